@@ -0,0 +1,181 @@
+"""
+Shared plumbing for the University Admission Portal Locust scenarios.
+
+Holds everything locust-load-test.py and locust-advanced-test.py have in
+common: the JSON helpers, the auth token pool, the pre-serialized request
+body templates, the abstract user with registration/login, and the event
+listeners (registered once even when both scenario files are loaded into
+the same Locust run).
+"""
+
+import collections
+import random
+import time
+
+from locust import events
+from locust.contrib.fasthttp import FastHttpUser
+from gevent.lock import Semaphore
+
+# Pool of pre-registered (email, token, expires_at) tuples shared across all
+# users in this process, so spawning a user does not always cost two auth
+# requests against the backend. Tokens are discarded a minute before expiry.
+_TOKEN_TTL = 15 * 60
+_TOKEN_POOL = collections.deque()
+_token_pool_lock = Semaphore()
+
+# orjson encodes/decodes JSON several times faster than the stdlib; fall back
+# to the stdlib so the tests stay runnable where orjson is not installed.
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    import json
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+    def _json_loads(data):
+        return json.loads(data)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Request bodies are pre-serialized to bytes once so the hot task loops do
+# not pay for a dict allocation plus json.dumps on every POST; only the
+# variable fields are filled in with a C-level bytes % substitution.
+_APPLICATION_BODY_TEMPLATE = (
+    b'{"personalStatement":"This is application #%d. '
+    b'I am passionate about studying at this university and '
+    b'believe my background makes me a strong candidate."}'
+)
+_PAYMENT_BODY_TEMPLATE = b'{"applicationId":"%s","amount":7500,"currency":"usd"}'
+
+
+def generate_random_string(length):
+    """Generate a random hex string used to build unique emails."""
+    # Single C-level call instead of a Python-level random.choice loop;
+    # this runs on every user spawn, so it matters at high spawn rates.
+    return random.randbytes((length + 1) // 2).hex()[:length]
+
+
+def _percentiles_from_histogram(times, percentiles):
+    """Read several percentiles from a sorted (response_time, count)
+    histogram in one cumulative pass, instead of re-walking the histogram
+    per percentile as get_response_time_percentile does."""
+    total = sum(count for _, count in times)
+    if total == 0:
+        return [0] * len(percentiles)
+
+    thresholds = [p * total for p in percentiles]
+    results = []
+    cumulative = 0
+    idx = 0
+    for response_time, count in times:
+        cumulative += count
+        while idx < len(thresholds) and cumulative >= thresholds[idx]:
+            results.append(response_time)
+            idx += 1
+        if idx == len(thresholds):
+            break
+    while len(results) < len(percentiles):
+        results.append(times[-1][0])
+    return results
+
+
+# Guard against double registration when both scenario files are loaded in
+# the same run; a second registration would make every listener fire twice.
+if not getattr(events, "_portal_hooked", False):
+    events._portal_hooked = True
+
+    @events.test_start.add_listener
+    def on_test_start(environment, **kwargs):
+        print("Starting University Admission Portal load test...")
+
+    @events.test_stop.add_listener
+    def on_test_stop(environment, **kwargs):
+        # Snapshot the aggregate entry once and format from locals so
+        # teardown does not repeatedly walk the stats structures.
+        total = environment.stats.total
+        times = sorted(total.response_times.items())
+        p95, p99 = _percentiles_from_histogram(times, (0.95, 0.99))
+
+        print("\n=== Load Test Summary ===")
+        print(f"Total requests:        {total.num_requests}")
+        print(f"Total failures:        {total.num_failures}")
+        print(f"Average response time: {total.avg_response_time:.2f} ms")
+        print(f"Median response time:  {total.median_response_time} ms")
+        print(f"95th percentile:       {p95} ms")
+        print(f"99th percentile:       {p99} ms")
+        print(f"Requests per second:   {total.total_rps:.2f}")
+
+
+class UniversityPortalUser(FastHttpUser):
+    """Shared registration/login plumbing for all user types."""
+
+    abstract = True
+    network_timeout = 30.0
+    connection_timeout = 10.0
+
+    def on_start(self):
+        self.auth_token = None
+        self.application_ids = []
+        self.acquire_auth_token()
+        # Built once per user and shared by every task; treat as read-only.
+        self.headers = {
+            "Authorization": f"Bearer {self.auth_token}",
+            "Content-Type": "application/json",
+        }
+
+    def acquire_auth_token(self):
+        """Reuse a pooled auth token when one is available, otherwise register."""
+        with _token_pool_lock:
+            while _TOKEN_POOL:
+                email, token, expires_at = _TOKEN_POOL.popleft()
+                if time.monotonic() < expires_at - 60:
+                    self.email = email
+                    self.auth_token = token
+                    self.token_expires_at = expires_at
+                    return
+        self.register_and_login()
+
+    def on_stop(self):
+        """Return a still-valid token to the pool for the next spawned user."""
+        if self.auth_token and time.monotonic() < self.token_expires_at - 60:
+            with _token_pool_lock:
+                _TOKEN_POOL.append((self.email, self.auth_token, self.token_expires_at))
+
+    def register_and_login(self):
+        """Create a fresh account and log in, storing the JWT for later tasks."""
+        suffix = generate_random_string(8)
+        self.email = f"loadtest_{suffix}@example.com"
+        self.password = "LoadTest123"
+
+        self.client.post(
+            "/auth/register",
+            data=_json_dumps({
+                "email": self.email,
+                "password": self.password,
+                "firstName": "Load",
+                "lastName": "Tester",
+            }),
+            headers=_JSON_HEADERS,
+            name="01_Register",
+        )
+
+        response = self.client.post(
+            "/auth/login",
+            data=_json_dumps({
+                "email": self.email,
+                "password": self.password,
+            }),
+            headers=_JSON_HEADERS,
+            name="02_Login",
+        )
+
+        if response.status_code == 200:
+            self.auth_token = _json_loads(response.content).get("access_token")
+            self.token_expires_at = time.monotonic() + _TOKEN_TTL
@@ -0,0 +1,252 @@
+"""
+Advanced Locust scenario for the University Admission Portal API.
+
+Models a mixed population of users against the NestJS backend:
+  - NormalUser (weight 7): completes the full submit -> status -> payment flow
+  - HeavyUser (weight 2): bulk-submits several applications per iteration
+  - StatusCheckerUser (weight 1): repeatedly polls application status
+
+Shared plumbing lives in _base.py.
+
+Usage:
+    cd backend
+    locust -f load-tests/locust-advanced-test.py --host http://localhost:3001
+"""
+
+import collections
+import os
+import random
+import time
+
+from locust import TaskSet, task, between
+import gevent
+from gevent import sleep as gsleep
+
+from _base import (
+    _APPLICATION_BODY_TEMPLATE,
+    _PAYMENT_BODY_TEMPLATE,
+    _json_loads,
+    UniversityPortalUser,
+)
+
+# Submitted application ids shared across user classes, so StatusCheckerUser
+# (which never submits anything itself) has something to poll. Entries carry
+# the submitting user's headers because the backend only serves an
+# application's status to its owner.
+_APP_ID_POOL = collections.deque(maxlen=10_000)
+
+_BULK_BODY_TEMPLATE = (
+    b'{"personalStatement":"Bulk application %d of %d. '
+    b'I am applying to multiple programs this cycle."}'
+)
+
+# Opt-in client-side cache for status polling (LOCUST_CLIENT_CACHE=1),
+# simulating a CDN tier in front of the status endpoint. Maps URL to
+# (expires_at, response).
+_CLIENT_CACHE_ENABLED = os.environ.get("LOCUST_CLIENT_CACHE") == "1"
+_CLIENT_CACHE_TTL = 1.0
+_RESPONSE_CACHE = {}
+
+
+class NormalUserBehavior(TaskSet):
+    """Applicant working through the submit -> status -> payment flow.
+
+    The flow is pipelined rather than serial: each stage is its own task
+    operating on per-user queues of (app_id, ready_at) entries, so no
+    greenlet sleeps through the whole three-step flow and the scheduler
+    keeps issuing requests while earlier stages "rest".
+    """
+
+    # Request labels resolved once at class-body time rather than rebuilt
+    # as literals inside the hot task bodies.
+    _NAME_SUBMIT = "03_Submit_Application"
+    _NAME_STATUS = "04_Check_Status"
+    _NAME_PAYMENT = "05_Process_Payment"
+
+    # Stage delays mirror the old serial flow's pacing: the status check
+    # one second after submitting, the payment two seconds after that.
+    _STATUS_DELAY = 1.0
+    _PAYMENT_DELAY = 2.0
+
+    def on_start(self):
+        self._awaiting_status = collections.deque()
+        self._awaiting_payment = collections.deque()
+
+    @task(4)
+    def _submit(self):
+        if not self.user.auth_token:
+            return
+
+        response = self.client.post(
+            "/applications",
+            data=_APPLICATION_BODY_TEMPLATE % (len(self.user.application_ids) + 1),
+            headers=self.user.headers,
+            name=self._NAME_SUBMIT,
+        )
+        if response.status_code in (200, 201, 202):
+            app_id = _json_loads(response.content).get("applicationId")
+            if app_id:
+                self.user.application_ids.append(app_id)
+                _APP_ID_POOL.append((app_id, self.user.headers))
+                self._awaiting_status.append(
+                    (app_id, time.monotonic() + self._STATUS_DELAY))
+
+    @task(3)
+    def _check(self):
+        if not self.user.auth_token or not self._awaiting_status:
+            return
+
+        app_id, ready_at = self._awaiting_status[0]
+        if ready_at > time.monotonic():
+            return
+        self._awaiting_status.popleft()
+
+        self.client.get(
+            f"/applications/{app_id}/status",
+            headers=self.user.headers,
+            name=self._NAME_STATUS,
+        )
+        self._awaiting_payment.append(
+            (app_id, time.monotonic() + self._PAYMENT_DELAY))
+
+    @task(3)
+    def _pay(self):
+        if not self.user.auth_token or not self._awaiting_payment:
+            return
+
+        app_id, ready_at = self._awaiting_payment[0]
+        if ready_at > time.monotonic():
+            return
+        self._awaiting_payment.popleft()
+
+        self.client.post(
+            "/payments/checkout",
+            data=_PAYMENT_BODY_TEMPLATE % app_id.encode(),
+            headers=self.user.headers,
+            name=self._NAME_PAYMENT,
+        )
+
+    @task(3)
+    def check_application_status(self):
+        if not self.user.auth_token or not self.user.application_ids:
+            return
+
+        app_id = random.choice(self.user.application_ids)
+
+        self.client.get(
+            f"/applications/{app_id}/status",
+            headers=self.user.headers,
+            name=self._NAME_STATUS,
+        )
+
+    @task(2)
+    def process_payment(self):
+        if not self.user.auth_token or not self.user.application_ids:
+            return
+
+        self.client.post(
+            "/payments/checkout",
+            data=_PAYMENT_BODY_TEMPLATE % random.choice(self.user.application_ids).encode(),
+            headers=self.user.headers,
+            name=self._NAME_PAYMENT,
+        )
+
+
+class HeavyUserBehavior(TaskSet):
+    """Power user submitting several applications back to back."""
+
+    _NAME_BULK = "06_Bulk_Submit"
+
+    @task
+    def bulk_application_submission(self):
+        if not self.user.auth_token:
+            return
+
+        num_applications = random.randint(3, 5)
+        # A heavy user fires its submissions concurrently; batching them onto
+        # the event loop multiplies requests per task iteration at the same
+        # wall time instead of serializing them with pacing sleeps.
+        jobs = [
+            gevent.spawn(self._post_one, i, num_applications)
+            for i in range(num_applications)
+        ]
+        gevent.joinall(jobs, timeout=30)
+
+    def _post_one(self, i, num_applications):
+        response = self.client.post(
+            "/applications",
+            data=_BULK_BODY_TEMPLATE % (i + 1, num_applications),
+            headers=self.user.headers,
+            name=self._NAME_BULK,
+        )
+        if response.status_code in (200, 201, 202):
+            app_id = _json_loads(response.content).get("applicationId")
+            if app_id:
+                self.user.application_ids.append(app_id)
+                _APP_ID_POOL.append((app_id, self.user.headers))
+
+
+class StatusPollerBehavior(TaskSet):
+    """Anxious applicant refreshing the status page over and over."""
+
+    _NAME_POLL = "07_Poll_Status"
+
+    def _poll_once(self, url, headers):
+        """Single status GET, optionally served from the client-side cache.
+
+        With LOCUST_CLIENT_CACHE=1 repeated polls of the same application
+        within the TTL are answered locally, modeling a CDN tier in front
+        of the status endpoint; cache hits issue no request and record no
+        stats. With the cache disabled, behavior is unchanged.
+        """
+        if _CLIENT_CACHE_ENABLED:
+            now = time.monotonic()
+            cached = _RESPONSE_CACHE.get(url)
+            if cached is not None and cached[0] > now:
+                return
+
+        response = self.client.get(
+            url,
+            headers=headers,
+            name=self._NAME_POLL,
+        )
+
+        if _CLIENT_CACHE_ENABLED:
+            _RESPONSE_CACHE[url] = (time.monotonic() + _CLIENT_CACHE_TTL, response)
+
+    @task
+    def poll_status_repeatedly(self):
+        if not self.user.auth_token:
+            return
+
+        if self.user.application_ids:
+            app_id, headers = random.choice(self.user.application_ids), self.user.headers
+        elif _APP_ID_POOL:
+            # Fall back to an application submitted by another user class.
+            app_id, headers = random.choice(_APP_ID_POOL)
+        else:
+            return
+
+        url = f"/applications/{app_id}/status"
+
+        for _ in range(5):
+            self._poll_once(url, headers)
+            gsleep(1)
+
+
+class NormalUser(UniversityPortalUser):
+    weight = 7
+    tasks = [NormalUserBehavior]
+    wait_time = between(1, 5)
+
+
+class HeavyUser(UniversityPortalUser):
+    weight = 2
+    tasks = [HeavyUserBehavior]
+    wait_time = between(2, 5)
+
+
+class StatusCheckerUser(UniversityPortalUser):
+    weight = 1
+    tasks = [StatusPollerBehavior]
+    wait_time = between(1, 3)
@@ -0,0 +1,93 @@
+"""
+Locust load test for the University Admission Portal API.
+
+Simulates applicants registering, logging in, submitting applications,
+reviewing their applications and initiating admission-fee payments
+against the NestJS backend. Shared plumbing lives in _base.py.
+
+Usage:
+    cd backend
+    locust -f load-tests/locust-load-test.py --host http://localhost:3001
+
+Then open http://localhost:8089 for the Locust web UI, or run headless:
+    locust -f load-tests/locust-load-test.py --host http://localhost:3001 \
+        --headless --users 100 --spawn-rate 10 --run-time 5m
+"""
+
+import itertools
+import random
+
+from locust import TaskSet, between
+
+from _base import (
+    _APPLICATION_BODY_TEMPLATE,
+    _PAYMENT_BODY_TEMPLATE,
+    _json_loads,
+    UniversityPortalUser,
+)
+
+
+class PortalTaskSet(TaskSet):
+    """Applicant tasks with a dispatch table precomputed at class-body time.
+
+    Instead of letting Locust expand @task weights into a repeated list,
+    the 10/5/3 weighting is kept as a cumulative-weight tuple built once;
+    get_next_task then picks a task with a single random.choices call.
+    """
+
+    # Request labels resolved once at class-body time rather than rebuilt
+    # as literals inside the hot task bodies.
+    _NAME_SUBMIT = "03_Submit_Application"
+    _NAME_DETAILS = "04_Get_Application_Details"
+    _NAME_PAYMENT = "05_Initiate_Payment"
+
+    def submit_application(self):
+        if not self.user.auth_token:
+            return
+
+        response = self.client.post(
+            "/applications",
+            data=_APPLICATION_BODY_TEMPLATE % (len(self.user.application_ids) + 1),
+            headers=self.user.headers,
+            name=self._NAME_SUBMIT,
+        )
+        if response.status_code in (200, 201, 202):
+            app_id = _json_loads(response.content).get("applicationId")
+            if app_id:
+                self.user.application_ids.append(app_id)
+
+    def get_application_details(self):
+        if not self.user.auth_token or not self.user.application_ids:
+            return
+
+        app_id = random.choice(self.user.application_ids)
+
+        self.client.get(
+            f"/applications/{app_id}",
+            headers=self.user.headers,
+            name=self._NAME_DETAILS,
+        )
+
+    def initiate_payment(self):
+        if not self.user.auth_token or not self.user.application_ids:
+            return
+
+        self.client.post(
+            "/payments/checkout",
+            data=_PAYMENT_BODY_TEMPLATE % random.choice(self.user.application_ids).encode(),
+            headers=self.user.headers,
+            name=self._NAME_PAYMENT,
+        )
+
+    _population = (submit_application, get_application_details, initiate_payment)
+    _cum_weights = tuple(itertools.accumulate((10, 5, 3)))
+
+    def get_next_task(self):
+        return random.choices(self._population, cum_weights=self._cum_weights, k=1)[0]
+
+
+class PortalUser(UniversityPortalUser):
+    """A single applicant working through the admission portal."""
+
+    tasks = [PortalTaskSet]
+    wait_time = between(1, 3)
@@ -0,0 +1,97 @@
+"""
+Multi-process launcher for the Locust load tests.
+
+Locust runs on gevent inside a single Python interpreter, so one worker
+saturates a single CPU core long before it saturates the backend, capping
+the RPS the client can generate. This launcher starts Locust in
+master/worker mode with one worker process per physical core so each
+process owns its own GIL and event loop, scaling generated load
+near-linearly with core count.
+
+The HttpUser classes in the test files are picked up unchanged by every
+worker, so the user class weight ratios (7/2/1 in the advanced scenario)
+are preserved per worker and therefore in aggregate.
+
+Usage:
+    cd backend
+    python load-tests/run-distributed.py --host http://localhost:3001 \
+        --users 1000 --spawn-rate 100 --run-time 5m
+
+    # Use the advanced scenario instead of the default one:
+    python load-tests/run-distributed.py -f load-tests/locust-advanced-test.py ...
+"""
+
+import argparse
+import multiprocessing
+import os
+import subprocess
+import sys
+
+DEFAULT_TEST_FILE = os.path.join(os.path.dirname(__file__), "locust-load-test.py")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run Locust with one worker per CPU core")
+    parser.add_argument("-f", "--locustfile", default=DEFAULT_TEST_FILE,
+                        help="Locust test file to run (default: locust-load-test.py)")
+    parser.add_argument("--host", default="http://localhost:3001",
+                        help="Base URL of the system under test")
+    parser.add_argument("--users", type=int, default=100,
+                        help="Total number of simulated users")
+    parser.add_argument("--spawn-rate", type=int, default=10,
+                        help="Users spawned per second")
+    parser.add_argument("--run-time", default=None,
+                        help="Test duration, e.g. 5m (headless mode only)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker process count (default: CPU core count)")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run without the web UI")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    worker_count = args.workers or multiprocessing.cpu_count()
+
+    workers = []
+    for _ in range(worker_count):
+        workers.append(subprocess.Popen([
+            "locust",
+            "-f", args.locustfile,
+            "--worker",
+            "--master-host", "127.0.0.1",
+        ]))
+
+    master_cmd = [
+        "locust",
+        "-f", args.locustfile,
+        "--master",
+        "--expect-workers", str(worker_count),
+        "--host", args.host,
+        "--users", str(args.users),
+        "--spawn-rate", str(args.spawn_rate),
+    ]
+    if args.headless:
+        master_cmd.append("--headless")
+        if args.run_time:
+            master_cmd.extend(["--run-time", args.run_time])
+
+    print(f"Starting Locust master with {worker_count} workers...")
+    master = subprocess.Popen(master_cmd)
+
+    try:
+        exit_code = master.wait()
+    except KeyboardInterrupt:
+        master.terminate()
+        exit_code = 130
+    finally:
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.wait()
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()